@@ -22,37 +22,92 @@ from PySide import QtGui, QtCore
 import time
 import sys
 
-# --- Cleanup helper ---
-def cleanup_interims(doc, names, label=None, verbose=False):
-    """Remove interim objects by name if they still exist in the document."""
-    for name in names:
-        obj = doc.getObject(name)
-        if obj:
-            try:
-                doc.removeObject(name)
-                if verbose and label:
-                    FreeCAD.Console.PrintMessage(f"🧹 Cleaned up {label}: {name}\n")
-            except Exception as e:
-                if verbose:
-                    FreeCAD.Console.PrintError(f"⚠️ Could not remove {name}: {e}\n")
-    doc.recompute()
+# With skip_refine_small, clean solids below this facet count skip the refine step
+REFINE_SKIP_FACET_LIMIT = 20000
+
+# makeShapeFromMesh tolerance; with scale_tolerance it is instead a fraction of the
+# mesh bounding-box diagonal (gives the default 0.1 for a 1 m part)
+DEFAULT_MESH_TOLERANCE = 0.1
+MESH_TOLERANCE_RATIO = 1e-4
+
+# --- Event pump ---
+def pump_events():
+    """Process paint/timer events only, so a click cannot re-enter the macro mid-run."""
+    QtGui.QApplication.processEvents(
+        QtCore.QEventLoop.ExcludeUserInputEvents | QtCore.QEventLoop.ExcludeSocketNotifiers
+    )
+
+# --- Tolerance matched to mesh scale ---
+def mesh_tolerance(mesh):
+    """Return a makeShapeFromMesh tolerance proportional to the mesh size."""
+    bbox = mesh.BoundBox
+    if not bbox.isValid() or bbox.DiagonalLength <= 0:
+        return DEFAULT_MESH_TOLERANCE
+    return max(bbox.DiagonalLength * MESH_TOLERANCE_RATIO, 1e-6)
 
 # --- Conservative repair ---
-def attempt_mesh_repair(mesh_obj):
+def attempt_mesh_repair(mesh_obj, stats=None):
+    """Repair a solid mesh in place; stats from evaluate_mesh spare repeating its checks."""
+    stats = stats or {}
     try:
         mesh = mesh_obj.Mesh
-        if not mesh.isSolid():
+        is_solid = stats.get("is_solid")
+        if is_solid is None:
+            is_solid = mesh.isSolid()
+        if not is_solid:
             FreeCAD.Console.PrintMessage("🔧 Skipping repair: mesh is not solid (repairs can be destructive on overlap).\n")
             return False
         FreeCAD.Console.PrintMessage(f"🔧 Conservative repair for '{mesh_obj.Name}'...\n")
-        mutable_mesh = Mesh.Mesh(mesh.Topology)
-        if hasattr(mutable_mesh, "harmonizeNormals"):
-            mutable_mesh.harmonizeNormals()
-        for method in ["removeDuplicatedPoints", "removeDuplicatedFacets", "removeInvalidPoints"]:
-            if hasattr(mutable_mesh, method):
-                getattr(mutable_mesh, method)()
-        if hasattr(mutable_mesh, "fillupHoles"):
+        # (repair, precheck): a repair only runs when its precheck reports a defect;
+        # the mesh is copied lazily right before the first repair that runs.
+        repairs = [
+            ("harmonizeNormals", "hasNonUniformOrientedFacets"),
+            ("removeDuplicatedPoints", "hasNonManifolds"),
+            ("removeDuplicatedFacets", "hasNonManifolds"),
+            ("removeNonManifolds", "hasNonManifolds"),
+            ("removeInvalidPoints", "hasInvalidPoints"),
+        ]
+        # Only the first self-intersection fixer this FreeCAD provides runs (older versions lack the first ones)
+        for method in ("fixSelfIntersections", "removeSelfIntersections", "removeFoldsOnSurface"):
+            if hasattr(mesh, method):
+                repairs.append((method, "hasSelfIntersections"))
+                break
+        # Check results already known for the unmodified mesh (None = not evaluated)
+        known = {
+            "hasNonManifolds": stats.get("non_manifolds"),
+            "hasSelfIntersections": stats.get("self_intersections"),
+        }
+        mutable_mesh = None
+        normals_flipped = False  # the only repair that changes the mesh without changing its counts
+        for method, precheck in repairs:
+            current = mutable_mesh if mutable_mesh is not None else mesh
+            if not hasattr(current, method):
+                continue
+            if mutable_mesh is None and known.get(precheck) is not None:
+                has_defect = known[precheck]
+            elif hasattr(current, precheck):
+                has_defect = getattr(current, precheck)()
+            else:
+                has_defect = True
+            if not has_defect:
+                continue
+            if mutable_mesh is None:
+                mutable_mesh = Mesh.Mesh(mesh)
+            getattr(mutable_mesh, method)()
+            normals_flipped = normals_flipped or method == "harmonizeNormals"
+        if mutable_mesh is not None and hasattr(mutable_mesh, "fillupHoles") and not mutable_mesh.isSolid():
             mutable_mesh.fillupHoles(100)
+        modified = mutable_mesh is not None and (
+            normals_flipped
+            or mutable_mesh.CountFacets != mesh.CountFacets
+            or mutable_mesh.CountPoints != mesh.CountPoints
+        )
+        if mutable_mesh is None:
+            FreeCAD.Console.PrintMessage("🔧 No repairable defects found, mesh left unchanged.\n")
+            return False
+        if not modified:
+            FreeCAD.Console.PrintMessage("🔧 Repair ran but made no change, mesh left unchanged.\n")
+            return False
         mesh_obj.Mesh = mutable_mesh
         FreeCAD.ActiveDocument.recompute()
         return mutable_mesh.isSolid() and not mutable_mesh.hasNonManifolds() and not mutable_mesh.hasSelfIntersections()
@@ -60,60 +115,68 @@ def attempt_mesh_repair(mesh_obj):
         FreeCAD.Console.PrintError(f"Repair failed: {e}\n")
         return False
 
+# --- OCC build ---
+def shell_from_shape(shape):
+    """Build a shell directly from a shape, without materializing its Faces list."""
+    try:
+        return Part.Shell(shape)
+    except Exception:
+        # Older Part.Shell only accepts a sequence of faces
+        return Part.Shell(shape.Faces)
+
+def build_solid(mesh, refine=True, tolerance=DEFAULT_MESH_TOLERANCE):
+    """Build (solid, refined or None) from a Mesh.Mesh, pumping Qt events between OCC steps."""
+    topo = mesh.Topology  # single getTopology() walk; this local is the only reference
+    shape = Part.Shape()
+    shape.makeShapeFromMesh(topo, tolerance, False)
+    del topo  # free the (points, facets) tuples before the solid is built
+    pump_events()
+    if shape.isNull() or not shape.countElement("Face"):
+        raise ValueError("No faces to build solid")
+    solid = Part.Solid(shell_from_shape(shape))
+    pump_events()
+    refined = None
+    if refine:
+        if not solid.isValid():
+            return solid, Part.Shape()  # skip the costly refine; empty → caller warns, keeps unrefined solid
+        try:
+            refined = solid.removeSplitter()  # same refine as Part::Refine
+        except Exception:
+            refined = Part.Shape()  # empty → caller falls back to the unrefined solid
+        pump_events()
+    return solid, refined
+
 # --- Convert mesh to solid ---
-def convert_mesh_to_solid(mesh_obj, base_name, doc):
+def convert_mesh_to_solid(mesh, base_name, doc, skip_refine=False, tolerance=DEFAULT_MESH_TOLERANCE):
+    """Convert a Mesh.Mesh to a '<base_name>_solid_simple' Part feature."""
     try:
-        # Mesh → Shape
-        shape_obj = doc.addObject('Part::Feature', base_name + "_shape")
-        shape = Part.Shape()
-        shape.makeShapeFromMesh(mesh_obj.Mesh.Topology, 0.1, False)
-        shape_obj.Shape = shape
-
-        if not shape_obj.Shape.Faces:
-            raise ValueError("No faces to build solid")
-
-        # Shape → Solid
-        solid_obj = doc.addObject("Part::Feature", base_name + "_solid")
-        solid_obj.Shape = Part.Solid(Part.Shell(shape_obj.Shape.Faces))
-
-        # Solid → Refine
-        refined_obj = doc.addObject("Part::Refine", base_name + "_solid_refined")
-        refined_obj.Source = solid_obj
-        solid_obj.Visibility = False
-        doc.recompute()
+        # Mesh → Shape → Solid → Refine as transient shapes;
+        # only the final keeper is added to the document.
+        solid, refined = build_solid(mesh, refine=not skip_refine, tolerance=tolerance)
 
         # --- Pragmatic validity check ---
         target_shape = None
-        if refined_obj.Shape and refined_obj.Shape.Solids:
+        if refined is not None and refined.Solids:
             # Refined solid exists and has solids → keep it
-            target_shape = refined_obj.Shape
-        elif solid_obj.Shape and solid_obj.Shape.Solids:
-            # Refine failed, but unrefined solid is usable → fallback
-            FreeCAD.Console.PrintMessage(
-                f"⚠️ Refine invalid for {base_name}, keeping unrefined solid\n"
-            )
-            target_shape = solid_obj.Shape
+            target_shape = refined
+        elif solid.Solids:
+            # Refine skipped or failed, but unrefined solid is usable → fallback
+            if refined is not None:
+                FreeCAD.Console.PrintMessage(
+                    f"⚠️ Refine invalid for {base_name}, keeping unrefined solid\n"
+                )
+            target_shape = solid
         else:
             raise ValueError("No usable solid produced")
 
         # Final keeper: simple copy
         simple_copy_obj = doc.addObject("Part::Feature", base_name + "_solid_simple")
         simple_copy_obj.Shape = target_shape
-        simple_copy_obj.ViewObject.Visibility = True
-
-        # Delete interims
-        for o in (shape_obj, solid_obj, refined_obj):
-            if doc.getObject(o.Name):
-                doc.removeObject(o.Name)
-        doc.recompute()
 
         return True, simple_copy_obj, []
 
     except Exception as e:
-        for name in [base_name + "_shape", base_name + "_solid", base_name + "_solid_refined"]:
-            if doc.getObject(name):
-                doc.removeObject(name)
-        FreeCAD.Console.PrintError(f"❌ Solid conversion failed for '{mesh_obj.Name}': {e}\n")
+        FreeCAD.Console.PrintError(f"❌ Solid conversion failed for '{base_name}': {e}\n")
         return False, None, []
 
 # --- Compound solids ---
@@ -133,57 +196,69 @@ def fusion_solids(solids, base_name, doc):
     return True, fusion, []  # keep solids, they are part of the fusion
 
 # --- Split components ---
-def split_components_safe(mesh_obj, base_name, doc):
+def split_components_safe(mesh_obj):
+    """Return the separate component meshes (not added to the document) and whether there are several."""
     try:
         FreeCAD.Console.PrintMessage(f"🔄 Splitting components for '{mesh_obj.Name}'...\n")
         comps = mesh_obj.Mesh.getSeparateComponents()
-        comp_objs = []
-        for i, comp in enumerate(comps):
-            comp_name = f"{base_name}_comp_{i+1:02d}"
-            comp_obj = doc.addObject("Mesh::Feature", comp_name)
-            comp_obj.Mesh = comp
-            comp_objs.append(comp_obj)
-        doc.recompute()
-        FreeCAD.Console.PrintMessage(f"✅ Split produced {len(comp_objs)} components\n")
-        return comp_objs, (len(comp_objs) > 1)
+        FreeCAD.Console.PrintMessage(f"✅ Split produced {len(comps)} components\n")
+        return comps, (len(comps) > 1)
     except Exception as e:
         FreeCAD.Console.PrintError(f"SplitComponents failed for '{mesh_obj.Name}': {e}\n")
         return [], False
 
 # --- Evaluation order ---
-def evaluate_mesh(mesh_obj):
+def evaluate_mesh(mesh_obj, components=None):
+    """Return (decision, stats); each mesh check runs at most once, and only when needed.
+
+    Pass components when the caller already counted them to skip another mesh walk.
+    """
     mesh = mesh_obj.Mesh
-    comps = mesh.countComponents()
-    if comps > 1:
-        return "fusion"
-    if mesh.isSolid() and not mesh.hasNonManifolds() and not mesh.hasSelfIntersections():
-        return "proceed"
-    if not mesh.isSolid() and mesh.hasSelfIntersections():
-        return "try_split"
-    if mesh.isSolid():
-        return "try_repair"
-    return "repair"
+    if components is None:
+        components = mesh.countComponents()
+    stats = {
+        "facets": mesh.CountFacets,
+        "is_solid": None,
+        "non_manifolds": None,
+        "self_intersections": None,
+    }
+    if components > 1:
+        return "fusion", stats
+    stats["is_solid"] = mesh.isSolid()
+    if stats["is_solid"]:
+        stats["non_manifolds"] = mesh.hasNonManifolds()
+        if not stats["non_manifolds"]:
+            stats["self_intersections"] = mesh.hasSelfIntersections()
+            if not stats["self_intersections"]:
+                return "proceed", stats
+        return "try_repair", stats
+    stats["self_intersections"] = mesh.hasSelfIntersections()
+    if stats["self_intersections"]:
+        return "try_split", stats
+    return "repair", stats
 
 # --- Convert single mesh ---
-def convert_single_mesh(mesh_obj, doc):
+def convert_single_mesh(mesh_obj, doc, components=None, tolerance=DEFAULT_MESH_TOLERANCE, skip_refine_small=False):
     base_name = mesh_obj.Name
-    decision = evaluate_mesh(mesh_obj)
+    decision, stats = evaluate_mesh(mesh_obj, components)
 
-    interims = []  # names to delete on success/failure
+    final_solid = body = None
+    solids = []  # component solids, kept until the Body is created
     try:
         if decision == "proceed":
-            success, final_solid, _ = convert_mesh_to_solid(mesh_obj, base_name, doc)
+            skip_refine = skip_refine_small and stats["facets"] < REFINE_SKIP_FACET_LIMIT
+            if skip_refine:
+                FreeCAD.Console.PrintMessage(
+                    f"⏩ Skipping refine for '{mesh_obj.Name}' (clean, under {REFINE_SKIP_FACET_LIMIT} facets)\n"
+                )
+            success, final_solid, _ = convert_mesh_to_solid(mesh_obj.Mesh, base_name, doc, skip_refine, tolerance)
 
         elif decision == "fusion":
-            comp_objs, _ = split_components_safe(mesh_obj, base_name, doc)
-            interims.extend([c.Name for c in comp_objs])  # mesh features are interim
-
-            solids = []
-            for i, comp_obj in enumerate(comp_objs):
-                comp_name = comp_obj.Name
-                success_i, solid_i, _ = convert_mesh_to_solid(comp_obj, f"{base_name}_comp_{i+1:02d}", doc)
-                if doc.getObject(comp_name):
-                    doc.removeObject(comp_name)  # remove mesh feature
+            comps, _ = split_components_safe(mesh_obj)
+
+            for i, comp in enumerate(comps):
+                comp_name = f"{base_name}_comp_{i+1:02d}"
+                success_i, solid_i, _ = convert_mesh_to_solid(comp, comp_name, doc, tolerance=tolerance)
                 if success_i and solid_i:
                     solids.append(solid_i)
                 else:
@@ -192,16 +267,12 @@ def convert_single_mesh(mesh_obj, doc):
             success, final_solid, _ = fusion_solids(solids, base_name, doc)
 
         elif decision == "try_split":
-            comp_objs, is_true_comp = split_components_safe(mesh_obj, base_name, doc)
-            interims.extend([c.Name for c in comp_objs])
+            comps, is_true_comp = split_components_safe(mesh_obj)
 
             if is_true_comp:
-                solids = []
-                for i, comp_obj in enumerate(comp_objs):
-                    comp_name = comp_obj.Name
-                    success_i, solid_i, _ = convert_mesh_to_solid(comp_obj, f"{base_name}_comp_{i+1:02d}", doc)
-                    if doc.getObject(comp_name):
-                        doc.removeObject(comp_name)
+                for i, comp in enumerate(comps):
+                    comp_name = f"{base_name}_comp_{i+1:02d}"
+                    success_i, solid_i, _ = convert_mesh_to_solid(comp, comp_name, doc, tolerance=tolerance)
                     if success_i and solid_i:
                         solids.append(solid_i)
                     else:
@@ -209,12 +280,12 @@ def convert_single_mesh(mesh_obj, doc):
                 success, final_solid, _ = fusion_solids(solids, base_name, doc)
             else:
                 FreeCAD.Console.PrintMessage("🧩 Split produced only one component, treating as single mesh.\n")
-                success, final_solid, _ = convert_mesh_to_solid(mesh_obj, base_name, doc)
+                success, final_solid, _ = convert_mesh_to_solid(mesh_obj.Mesh, base_name, doc, tolerance=tolerance)
 
         elif decision == "try_repair":
             FreeCAD.Console.PrintMessage(f"🔧 Attempting repair for '{mesh_obj.Name}'...\n")
-            if attempt_mesh_repair(mesh_obj):
-                success, final_solid, _ = convert_mesh_to_solid(mesh_obj, base_name, doc)
+            if attempt_mesh_repair(mesh_obj, stats):
+                success, final_solid, _ = convert_mesh_to_solid(mesh_obj.Mesh, base_name, doc, tolerance=tolerance)
             else:
                 FreeCAD.Console.PrintMessage(f"⏭️ Skipping '{mesh_obj.Name}' (repair not successful)\n")
                 return False, None
@@ -233,9 +304,6 @@ def convert_single_mesh(mesh_obj, doc):
             if doc.getObject(mesh_obj.Name):
                 doc.removeObject(mesh_obj.Name)
 
-            # SUCCESS CLEANUP: remove interim mesh features
-            cleanup_interims(doc, interims, label="mesh component")
-
             doc.recompute()
             FreeCAD.Console.PrintMessage(f"✅ Created Body: {body.Name}\n")
             return True, (mesh_name, body.Name)
@@ -244,12 +312,13 @@ def convert_single_mesh(mesh_obj, doc):
 
     except Exception as e:
         FreeCAD.Console.PrintMessage(f"❌ Conversion failed for '{mesh_obj.Name}': {e}\n")
-        # FAILURE CLEANUP
-        cleanup_interims(doc, interims, label="failure cleanup")
-        for suffix in ["_Body", "_fusion"]:
-            name = f"{base_name}{suffix}"
-            if doc.getObject(name):
-                doc.removeObject(name)
+        # FAILURE CLEANUP: remove the Body, final solid and component solids, by reference
+        for obj in [body, final_solid] + [s for s in solids if s is not final_solid]:
+            if obj is not None:
+                try:
+                    doc.removeObject(obj.Name)
+                except Exception:
+                    pass
         doc.recompute()
         return False, None
 
@@ -261,49 +330,59 @@ def should_skip_for_component_count(mesh_obj, total_meshes):
     return False, comps
 
 # --- Unified entry point with pre-collection, sorted schedule, and per-mesh transactions ---
-def run_unified_macro(auto_mode=True):
+def run_unified_macro(auto_mode=True, skip_refine_small=False, tolerance=None, scale_tolerance=False):
+    """Convert selected (or all) meshes to Bodies.
+
+    tolerance overrides the makeShapeFromMesh tolerance (default DEFAULT_MESH_TOLERANCE);
+    scale_tolerance derives it per mesh from the bounding-box diagonal instead.
+    """
+    if tolerance is None:
+        tolerance = DEFAULT_MESH_TOLERANCE
     doc = FreeCAD.ActiveDocument
 
     # Initial banner
     FreeCAD.Console.PrintMessage("\n🚀 Mesh-to-Body macro started...\n")
-    QtGui.QApplication.processEvents()
+    pump_events()
     sys.stdout.flush()
 
     # Collect selection or all meshes
     selection = FreeCADGui.Selection.getSelection()
     if selection:
-        mesh_objects = [obj for obj in selection if hasattr(obj, 'Mesh')]
+        mesh_objects = [obj for obj in selection if obj.isDerivedFrom("Mesh::Feature")]
         FreeCAD.Console.PrintMessage(f"Found {len(mesh_objects)} selected meshes...\n")
     else:
-        mesh_objects = [obj for obj in doc.Objects if hasattr(obj, 'Mesh')]
+        mesh_objects = [obj for obj in doc.Objects if obj.isDerivedFrom("Mesh::Feature")]
         FreeCAD.Console.PrintMessage(f"No selection found. Found {len(mesh_objects)} meshes in document...\n")
 
-    QtGui.QApplication.processEvents()
+    pump_events()
     sys.stdout.flush()
 
     # --- Pre-collect metadata ---
     metadata = []
     for obj in mesh_objects:
+        mesh_data = obj.Mesh  # one wrapper per mesh
         metadata.append({
             "obj": obj,
             "name": obj.Name,
-            "facets": obj.Mesh.CountFacets,
-            "components": obj.Mesh.countComponents()
+            "facets": mesh_data.CountFacets,
+            "components": mesh_data.countComponents(),
+            "tolerance": mesh_tolerance(mesh_data) if scale_tolerance else tolerance
         })
 
     # --- Sort: first by components, then by facets ---
     metadata.sort(key=lambda m: (m["components"], m["facets"]))
 
     # --- Print schedule only ---
-    FreeCAD.Console.PrintMessage("\n📋 Conversion schedule:\n")
+    log_lines = ["\n📋 Conversion schedule:"]
     for idx, m in enumerate(metadata, 1):
-        FreeCAD.Console.PrintMessage(
-            f"{idx}. {m['name']} — {m['components']} components, {m['facets']} facets\n"
-        )
-    QtGui.QApplication.processEvents()
+        log_lines.append(f"{idx}. {m['name']} — {m['components']} components, {m['facets']} facets")
+    FreeCAD.Console.PrintMessage("\n".join(log_lines) + "\n")
+    pump_events()
     sys.stdout.flush()
 
     # --- Conversion loop ---
+    # Meshes are converted one at a time: every step after the OCC build (split, repair,
+    # fusion, Body creation) edits the open document inside a per-mesh transaction.
     results = {"converted": 0, "skipped": 0}
     skip_reasons = []
     total_start = time.perf_counter()
@@ -325,25 +404,22 @@ def run_unified_macro(auto_mode=True):
             continue
 
         # Header + counts + warnings + start marker together
-        FreeCAD.Console.PrintMessage(
-            f"\n=== [{idx}/{len(metadata)}] {m['name']} ===\n"
-            f"📐 {m['name']} has {facets} facets, {comps} components\n"
-        )
+        log_lines = [
+            f"\n=== [{idx}/{len(metadata)}] {m['name']} ===",
+            f"📐 {m['name']} has {facets} facets, {comps} components",
+        ]
         if facets > 10000:
-            FreeCAD.Console.PrintMessage(
-                f"⏳ {m['name']} exceeds 10k facets. Expect long processing time...\n"
-            )
-        FreeCAD.Console.PrintMessage(
-            f"▶️ Starting conversion for {m['name']}, please wait...\n"
-        )
-        QtGui.QApplication.processEvents()
+            log_lines.append(f"⏳ {m['name']} exceeds 10k facets. Expect long processing time...")
+        log_lines.append(f"▶️ Starting conversion for {m['name']}, please wait...")
+        FreeCAD.Console.PrintMessage("\n".join(log_lines) + "\n")
+        pump_events()
         sys.stdout.flush()
 
         # Conversion
         doc.openTransaction(f"Convert {obj.Name}")
         start = time.perf_counter()
         try:
-            success, names = convert_single_mesh(obj, doc)
+            success, names = convert_single_mesh(obj, doc, comps, m["tolerance"], skip_refine_small)
             elapsed = time.perf_counter() - start
             if success:
                 mesh_name, body_name = names
@@ -361,22 +437,21 @@ def run_unified_macro(auto_mode=True):
             FreeCAD.Console.PrintError(f"❌ Error converting {obj.Name}: {e}\n")
         finally:
             doc.commitTransaction()
-            QtGui.QApplication.processEvents()
+            pump_events()
 
-    doc.recompute()
     total_elapsed = time.perf_counter() - total_start
 
     # --- Final summary ---
-    FreeCAD.Console.PrintMessage(
+    log_lines = [
         f"\n=== Conversion complete: {results['converted']} converted, "
-        f"{results['skipped']} skipped ===\n"
-    )
-    FreeCAD.Console.PrintMessage(f"⏱️ Total elapsed time: {total_elapsed:.2f}s\n")
-
+        f"{results['skipped']} skipped ===",
+        f"⏱️ Total elapsed time: {total_elapsed:.2f}s",
+    ]
     if skip_reasons:
-        FreeCAD.Console.PrintMessage("\n=== Skipped meshes due to component count ===\n")
+        log_lines.append("\n=== Skipped meshes due to component count ===")
         for name, comps in skip_reasons:
-            FreeCAD.Console.PrintMessage(f"⏭️ {name}: {comps} components. Rerun separately.\n")
+            log_lines.append(f"⏭️ {name}: {comps} components. Rerun separately.")
+    FreeCAD.Console.PrintMessage("\n".join(log_lines) + "\n")
 
     return results
 